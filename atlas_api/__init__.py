@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import logging
+import operator
 import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from importlib.metadata import version as im_version
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, Generic, List, Tuple, TypeVar
 
 import aiohttp
 import msgspec
 
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
+    from concurrent.futures import Future
     from types import TracebackType
 
     from typing_extensions import Self
@@ -28,17 +38,41 @@ else:
 __all__ = ("ATLAS_BASE_URL", "AtlasException", "Story", "Client", "extract_fic_id")
 
 
-_FFN_STORY_REGEX = re.compile(r"(https://|http://|)(www\.|m\.|)fanfiction\.net/s/(?P<id>\d+)")
-_DECODER = msgspec.json.Decoder()
+_FFN_STORY_REGEX = re.compile(r"(?:https?://)?(?:www\.|m\.)?fanfiction\.net/s/(?P<id>\d+)", re.ASCII)
+_FFN_STORY_BYTES_REGEX = re.compile(rb"(?:https?://)?(?:www\.|m\.)?fanfiction\.net/s/(?P<id>\d+)")
+_CHARACTERS_SPLIT_REGEX = re.compile(r"\s*[\[\],]\s*")
+_INT_DECODER = msgspec.json.Decoder(int)
 
 ATLAS_BASE_URL = "https://atlas.fanfic.dev/v0"
 
+_BULK_LIMIT = 10000
+_BULK_TIMEOUT = 10.0
+
+_T = TypeVar("_T")
+_KT = TypeVar("_KT")
+_VT = TypeVar("_VT")
+_RequestKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+_get_id = operator.attrgetter("id")
+
+_log = logging.getLogger(__name__)
+
 
 class AtlasException(Exception):
-    """The base exception for the Atlas API."""
+    """The base exception for the Atlas API.
+
+    Attributes
+    ----------
+    status: :class:`int` | None
+        The HTTP status code of the response that caused this, if any.
+    """
 
+    def __init__(self, *args: object, status: int | None = None) -> None:
+        super().__init__(*args)
+        self.status = status
 
-class Author(msgspec.Struct, frozen=True):
+
+class Author(msgspec.Struct, frozen=True, gc=False):
     """The basic metadata of a FanFiction.Net author.
 
     Attributes
@@ -59,7 +93,7 @@ class Author(msgspec.Struct, frozen=True):
         return f"https://www.fanfiction.net/u/{self.id}"
 
 
-class Story(msgspec.Struct, frozen=True):
+class Story(msgspec.Struct, frozen=True, gc=False):
     """The metadata of a FanFiction.Net (FFN) fic, retrieved from Atlas.
 
     Attributes
@@ -131,39 +165,235 @@ class Story(msgspec.Struct, frozen=True):
         return f"https://www.fanfiction.net/s/{self.id}"
 
 
-def shape_data(data: dict[str, Any]) -> dict[str, Any]:
-    # TODO: Find a way to optimize this.
-    updated: dict[str, Any] = {}
-    for key in data:
-        if "author" in key and (suffix := (key.split("_"))[1]):
-            updated.setdefault("author", {})[suffix] = data[key]
-        elif "fandom_id" in key:
-            updated.setdefault("fandom_ids", []).append(data[key])
-        elif "_count" in key:
-            updated[(key.split("_"))[0] + "s"] = data[key]
-    if chars := data["raw_characters"]:
-        updated["characters"] = [ch for ch in chars.replace("[", ", ").replace("]", ", ").split(", ") if ch.strip()]
-    if genres := data["raw_genres"]:
-        updated["genres"] = genres.split("/")
-    if fandoms := data["raw_fandoms"]:
-        split_fandoms = fandoms.split(" and ", 1)
+class _StoryPayload(msgspec.Struct, gc=False):
+    """The raw shape of a FanFiction.Net fic's metadata, as returned by Atlas."""
+
+    id: int
+    author_id: int
+    author_name: str
+    title: str
+    description: str
+    published: datetime
+    is_complete: bool
+    rating: str
+    language: str
+    chapter_count: int
+    word_count: int
+    review_count: int
+    favorite_count: int
+    follow_count: int
+    is_crossover: bool
+    updated: datetime | None = None
+    raw_genres: str | None = None
+    raw_characters: str | None = None
+    raw_fandoms: str | None = None
+    # Unset is kept apart from null, so only the ids the payload actually has end up in the story.
+    fandom_id0: int | None | msgspec.UnsetType = msgspec.UNSET
+    fandom_id1: int | None | msgspec.UnsetType = msgspec.UNSET
+
+
+_PAYLOAD_DECODER = msgspec.json.Decoder(_StoryPayload)
+_PAYLOAD_LIST_DECODER = msgspec.json.Decoder(List[_StoryPayload])
+
+
+def _shape_story(payload: _StoryPayload) -> Story:
+    characters: tuple[str, ...] = ()
+    genres: tuple[str, ...] = ()
+    fandoms: tuple[str, ...] = ()
+    if chars := payload.raw_characters:
+        characters = tuple(ch for ch in _CHARACTERS_SPLIT_REGEX.split(chars) if ch)
+    if raw_genres := payload.raw_genres:
+        genres = tuple(raw_genres.split("/"))
+    if raw_fandoms := payload.raw_fandoms:
+        split_fandoms = raw_fandoms.split(" and ", 1)
         if len(split_fandoms) > 1:
             split_fandoms[-1] = split_fandoms[-1].removesuffix(" Crossovers")
-        updated["fandoms"] = split_fandoms
-    data.update(updated)
-    return data
+        fandoms = tuple(split_fandoms)
+
+    return Story(
+        id=payload.id,
+        author=Author(payload.author_id, payload.author_name),
+        title=payload.title,
+        description=payload.description,
+        chapters=payload.chapter_count,
+        published=payload.published,
+        is_complete=payload.is_complete,
+        words=payload.word_count,
+        language=payload.language,
+        rating=payload.rating,
+        is_crossover=payload.is_crossover,
+        reviews=payload.review_count,
+        favorites=payload.favorite_count,
+        follows=payload.follow_count,
+        updated=payload.updated,
+        genres=genres,
+        characters=characters,
+        fandoms=fandoms,
+        fandom_ids=tuple(
+            fandom_id for fandom_id in (payload.fandom_id0, payload.fandom_id1) if fandom_id is not msgspec.UNSET
+        ),
+    )
 
 
 def parse_story(data: bytes | str) -> Story:
-    obj = _DECODER.decode(data)
-    obj = shape_data(obj)
-    return msgspec.convert(obj, type=Story)
+    return _shape_story(_PAYLOAD_DECODER.decode(data))
 
 
 def parse_story_list(data: bytes | str) -> list[Story]:
-    objs = _DECODER.decode(data)
-    objs = [shape_data(obj) for obj in objs]
-    return msgspec.convert(objs, type=List[Story])
+    return [_shape_story(payload) for payload in _PAYLOAD_LIST_DECODER.decode(data)]
+
+
+class _TTLCache(Generic[_KT, _VT]):
+    """A size-bounded mapping whose entries expire a fixed number of seconds after being set.
+
+    When full, the oldest entry is evicted to make room.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[_KT, tuple[float, _VT]] = {}
+
+    def get(self, key: _KT) -> _VT | None:
+        if (entry := self._data.get(key)) is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: _KT, value: _VT) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        if len(self._data) > self.maxsize:
+            del self._data[next(iter(self._data))]
+
+    def pop(self, key: _KT) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class _SharedRequest:
+    """An in-flight request that any number of callers can await.
+
+    The request is only cancelled once every caller awaiting it has been cancelled, after which new callers shouldn't
+    join it.
+    """
+
+    def __init__(self, request: asyncio.Future[bytes]) -> None:
+        self.request = request
+        self.waiters = 0
+        self.abandoned = False
+
+    async def wait(self) -> bytes:
+        self.waiters += 1
+        try:
+            # Shield the request so one caller's cancellation doesn't cancel it for the others.
+            return await asyncio.shield(self.request)
+        except asyncio.CancelledError:
+            if self.waiters == 1:
+                self.abandoned = True
+                self.request.cancel()
+            raise
+        finally:
+            self.waiters -= 1
+
+
+class _DiskCache:
+    """A persistent store of raw response bodies, kept in an SQLite database file.
+
+    Entries expire a fixed number of seconds after being set, and expired ones are purged whenever the database is
+    opened. All database work runs in submission order on one dedicated thread, so it never blocks the event loop.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], ttl: float) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _submit(self, func: Callable[..., _T], *args: Any) -> Future[_T]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="atlas_api_disk_cache")
+        return self._executor.submit(func, *args)
+
+    def _submit_quietly(self, func: Callable[..., Any], *args: Any) -> None:
+        # Nothing waits on these, so log any failure instead of letting it vanish with the future.
+        self._submit(func, *args).add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future: Future[Any]) -> None:
+        if (not future.cancelled()) and (exc := future.exception()) is not None:
+            _log.error("An operation on the on-disk cache failed.", exc_info=exc)
+
+    @staticmethod
+    def _format_key(key: _RequestKey) -> str:
+        endpoint, params = key
+        return f"{endpoint}?{'&'.join(f'{name}={value}' for name, value in params)}"
+
+    # The methods below only run on the cache's thread.
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, data BLOB NOT NULL)",
+                )
+                self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        return self._conn
+
+    def _get(self, key: str) -> bytes | None:
+        query = "SELECT data FROM responses WHERE key = ? AND expires_at > ?"
+        row: tuple[bytes] | None = self._connection.execute(query, (key, time.time())).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, data: bytes) -> None:
+        with self._connection as conn:
+            conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, time.time() + self.ttl, data))
+
+    def _pop(self, key: str) -> None:
+        with self._connection as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _clear(self) -> None:
+        with self._connection as conn:
+            conn.execute("DELETE FROM responses")
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # The methods below are called from the event loop.
+
+    async def get(self, key: _RequestKey) -> bytes | None:
+        # The cache is optional, so a broken one only counts as a miss.
+        try:
+            return await asyncio.wrap_future(self._submit(self._get, self._format_key(key)))
+        except sqlite3.Error:
+            _log.warning("Couldn't read from the on-disk cache at %s.", self.path, exc_info=True)
+            return None
+
+    def set(self, key: _RequestKey, data: bytes) -> None:
+        self._submit_quietly(self._set, self._format_key(key), data)
+
+    def pop(self, key: _RequestKey) -> None:
+        self._submit_quietly(self._pop, self._format_key(key))
+
+    def clear(self) -> None:
+        self._submit_quietly(self._clear)
+
+    async def close(self) -> None:
+        if self._executor is not None:
+            await asyncio.wrap_future(self._submit(self._close))
+            self._executor.shutdown()
+            self._executor = None
 
 
 class Client:
@@ -177,10 +407,15 @@ class Client:
     auth: :class:`BasicAuth`, optional
         The HTTP authentication details to use the API.
     headers: dict, optional
-        The HTTP headers to send with any requests.
+        The HTTP headers to send with any requests. If the client creates its own session, these become that session's
+        defaults when it's created, along with `auth` pre-encoded as the `Authorization` header. Otherwise, `auth` is
+        passed along with each request so it doesn't conflict with any default auth on the given session.
     sema_limit: :class:`int`
         The limit on the number of requests that can be made at once asynchronously. If not between 1 and 3, defaults
         to 3.
+    cache_path: :class:`str` | :class:`os.PathLike`, optional
+        The path of an SQLite database file to keep story metadata responses in for a day, so they persist between
+        runs. If not passed in, responses are only cached in memory.
     """
 
     def __init__(
@@ -190,12 +425,21 @@ class Client:
         headers: dict[str, Any] | None = None,
         session: aiohttp.ClientSession | None = None,
         sema_limit: int | None = None,
+        cache_path: str | os.PathLike[str] | None = None,
     ) -> None:
+        default_headers = {"User-Agent": f"Atlas API wrapper/v{im_version('atlas_api')}+@Thanos"}
+        self.headers = dict(headers) if headers else default_headers
         self._auth = auth
-        self.headers = headers or {"User-Agent": f"Atlas API wrapper/v{im_version('atlas_api')}+@Thanos"}
         self.session = session
+        self._owns_session = False
         self._sema_limit = sema_limit if (sema_limit and 1 <= sema_limit <= 3) else 2
-        self._semaphore = asyncio.Semaphore(value=self._sema_limit)
+        self._active_requests = 0
+        self._request_cond = asyncio.Condition()
+        self._wake_task: asyncio.Task[None] | None = None
+        self._response_cache: _TTLCache[_RequestKey, bytes] = _TTLCache(maxsize=64, ttl=30.0)
+        self._inflight_requests: dict[_RequestKey, _SharedRequest] = {}
+        self._story_cache: _TTLCache[int, Story] = _TTLCache(maxsize=4096, ttl=300.0)
+        self._disk_cache = _DiskCache(cache_path, ttl=86400.0) if cache_path else None
 
     async def __aenter__(self) -> Self:
         return self
@@ -216,28 +460,121 @@ class Client:
 
     @sema_limit.setter
     def sema_limit(self, value: int) -> None:
-        if 1 <= value <= 3:
-            self._sema_limit = value
-            self._semaphore = asyncio.Semaphore(value)
-        else:
+        if not (1 <= value <= 3):
             msg = "To prevent hitting the Atlas API too much, this limit has to be between 1 and 3 inclusive."
             raise ValueError(msg)
 
+        raised = value > self._sema_limit
+        self._sema_limit = value
+
+        # Waiters re-check the limit whenever a request finishes, but a raised limit should let them through now.
+        if raised:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # Nothing can be waiting on a request slot without a running loop.
+            else:
+                self._wake_task = loop.create_task(self._wake_request_waiters())
+
     async def start_session(self) -> None:
         """Start an HTTP session attached to this instance if necessary."""
 
         if (not self.session) or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            # Keep connections to Atlas alive between requests; the pool never needs more than the max sema_limit.
+            connector = aiohttp.TCPConnector(limit=3, ttl_dns_cache=300, keepalive_timeout=75)
+            # Encode the credentials once here instead of on every request.
+            headers = {**self.headers, "Authorization": self._auth.encode()} if self._auth else self.headers
+            self.session = aiohttp.ClientSession(connector=connector, headers=headers)
+            self._owns_session = True
 
     async def close(self) -> None:
-        """Close the HTTP session attached to this instance if necessary."""
+        """Close the HTTP session attached to this instance, as well as the on-disk cache, if necessary."""
 
         if self.session and (not self.session.closed):
             await self.session.close()
+        if self._disk_cache:
+            await self._disk_cache.close()
+
+    @contextlib.asynccontextmanager
+    async def _request_slot(self) -> AsyncGenerator[None, None]:
+        """Wait until fewer than :attr:`sema_limit` requests are active, then hold a slot until exiting."""
+
+        async with self._request_cond:
+            await self._request_cond.wait_for(lambda: self._active_requests < self._sema_limit)
+            self._active_requests += 1
+        try:
+            yield
+        finally:
+            async with self._request_cond:
+                self._active_requests -= 1
+                self._request_cond.notify(self._sema_limit - self._active_requests)
 
-    async def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> bytes:
+    async def _wake_request_waiters(self) -> None:
+        async with self._request_cond:
+            self._request_cond.notify_all()
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        cache: bool = False,
+        persist: bool = False,
+    ) -> bytes:
         """Gets FFN data from the Atlas API.
 
+        Identical requests made while one is already in flight share its response instead of being sent again. The
+        shared request is cancelled once every caller waiting on it has been cancelled.
+
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The path parameters for the endpoint.
+        params: dict[:class:`str`, Any] | None, optional
+            The query parameters to request from the endpoint.
+        cache: :class:`bool`, default=False
+            Whether to reuse and store the response for a short time.
+        persist: :class:`bool`, default=False
+            Whether to reuse and store the response in the on-disk cache, if there is one.
+
+        Returns
+        -------
+        :class:`bytes`
+            The data from the API response.
+
+        Raises
+        ------
+        AtlasException
+            If the API responds with an error status code.
+        """
+
+        key: _RequestKey = (endpoint, tuple(sorted(params.items())) if params else ())
+        if cache and (data := self._response_cache.get(key)) is not None:
+            return data
+        if persist and self._disk_cache and (data := await self._disk_cache.get(key)) is not None:
+            return data
+
+        # A request whose last caller was cancelled may still be winding down, so start a fresh one instead.
+        if ((shared := self._inflight_requests.get(key)) is None) or shared.abandoned:
+            request = asyncio.ensure_future(self._request(endpoint, params))
+            request.add_done_callback(functools.partial(self._finish_request, key, cache, persist))
+            shared = self._inflight_requests[key] = _SharedRequest(request)
+
+        return await shared.wait()
+
+    def _finish_request(self, key: _RequestKey, cache: bool, persist: bool, request: asyncio.Future[bytes]) -> None:
+        if (shared := self._inflight_requests.get(key)) and (shared.request is request):
+            del self._inflight_requests[key]
+        if request.cancelled() or (request.exception() is not None):
+            return
+        if cache:
+            self._response_cache.set(key, request.result())
+        if persist and self._disk_cache:
+            self._disk_cache.set(key, request.result())
+
+    async def _request(self, endpoint: str, params: dict[str, Any] | None = None) -> bytes:
+        """Makes a request to the Atlas API.
+
         This restricts the number of simultaneous requests.
 
         Parameters
@@ -255,45 +592,47 @@ class Client:
         Raises
         ------
         AtlasException
-            If there's a client response error.
+            If the API responds with an error status code.
         """
 
         await self.start_session()
         assert self.session
 
-        async with self._semaphore:
-            try:
-                url = ATLAS_BASE_URL + endpoint
-                async with self.session.get(url, params=params, headers=self.headers, auth=self._auth) as response:
-                    response.raise_for_status()
-                    return await response.read()
-            except aiohttp.ClientResponseError as exc:
-                msg = f"HTTP {exc.status}: {exc.message}"
-                raise AtlasException(msg) from None
+        # A session created by this client already sends the headers and auth by default.
+        headers, auth = (None, None) if self._owns_session else (self.headers, self._auth)
+
+        url = ATLAS_BASE_URL + endpoint
+        async with self._request_slot(), self.session.get(url, params=params, headers=headers, auth=auth) as response:
+            if response.status >= 400:
+                msg = f"HTTP {response.status}: {response.reason}"
+                raise AtlasException(msg, status=response.status)
+            return await response.read()
 
     async def max_update_id(self) -> int:
         """Gets the maximum `update_id` currently in use.
 
+        The result is reused for 30 seconds.
+
         Returns
         -------
         :class:`int`
             The update id.
         """
 
-        update_id: int = _DECODER.decode(await self._get("/update_id"))
-        return update_id
+        return _INT_DECODER.decode(await self._get("/update_id", cache=True))
 
     async def max_story_id(self) -> int:
         """Gets the maximum known FFN story `id`.
 
+        The result is reused for 30 seconds.
+
         Returns
         -------
         :class:`int`
             The story id.
         """
 
-        story_id: int = _DECODER.decode(await self._get("/ffn/id"))
-        return story_id
+        return _INT_DECODER.decode(await self._get("/ffn/id", cache=True))
 
     async def get_bulk_metadata(
         self,
@@ -338,28 +677,102 @@ class Client:
             If the `limit` parameter isn't between 1 and 10000.
         """
 
-        query: dict[str, Any] = {}
-
-        if min_update_id:
-            query["min_update_id"] = min_update_id
-        if min_fic_id:
-            query["min_fic_id"] = min_fic_id
-        if title_ilike:
-            query["title_ilike"] = title_ilike
-        if description_ilike:
-            query["description_ilike"] = description_ilike
-        if raw_fandoms_ilike:
-            query["raw_fandoms_ilike"] = raw_fandoms_ilike
-        if author_id:
-            query["author_id"] = author_id
-        if limit:
-            query["limit"] = limit
-
-        return parse_story_list(await self._get("/ffn/meta/", params=query))
+        if limit is not None and not (1 <= limit <= _BULK_LIMIT):
+            msg = f"The limit must be between 1 and {_BULK_LIMIT} inclusive."
+            raise ValueError(msg)
+
+        query: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("min_update_id", min_update_id),
+                ("min_fic_id", min_fic_id),
+                ("title_ilike", title_ilike),
+                ("description_ilike", description_ilike),
+                ("raw_fandoms_ilike", raw_fandoms_ilike),
+                ("author_id", author_id),
+                ("limit", limit),
+            )
+            if value is not None
+        }
+
+        data = await self._get("/ffn/meta/", params=query)
+
+        # Blocks can hold thousands of stories, so decode them in a thread to avoid stalling the event loop.
+        return await asyncio.get_running_loop().run_in_executor(None, parse_story_list, data)
+
+    async def iter_bulk_metadata(
+        self,
+        min_update_id: int | None = None,
+        min_fic_id: int | None = None,
+        title_ilike: str | None = None,
+        description_ilike: str | None = None,
+        raw_fandoms_ilike: str | None = None,
+        author_id: int | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[list[Story]]:
+        """Pages through all FFN story metadata that matches the given filters, one block at a time.
+
+        Each block starts after the largest FFN fic `id` in the previous one. The next block is requested as soon as
+        the current one arrives, so it downloads while the current block is being processed.
+
+        Parameters
+        ----------
+        min_update_id: :class:`int`, optional
+            The minimum `update_id` used to filter results.
+        min_fic_id: :class:`int`, optional
+            The minimum FFN fic `id` to start paging from.
+        title_ilike: :class:`str`, optional
+            A sql `ilike` query applied to `title` to filter results.
+        description_ilike: :class:`str`, optional
+            A sql `ilike` query applied to `description` to filter results.
+        raw_fandoms_ilike: :class:`str`, optional
+            A sql `ilike` query applied to `raw_fandoms` to filter results.
+        author_id: :class:`int`, optional
+            The `author_id` used to filter results.
+        limit: :class:`int`, optional
+            The maximum number of results in each block. The API's known upper limit is 10000.
+
+        Yields
+        ------
+        list[:class:`Story`]
+            A block of objects containing metadata for individual fics.
+
+        Raises
+        ------
+        ValueError
+            If the `limit` parameter isn't between 1 and 10000.
+        """
+
+        get_block = functools.partial(
+            self.get_bulk_metadata,
+            min_update_id=min_update_id,
+            title_ilike=title_ilike,
+            description_ilike=description_ilike,
+            raw_fandoms_ilike=raw_fandoms_ilike,
+            author_id=author_id,
+            limit=limit,
+        )
+
+        next_block = asyncio.ensure_future(get_block(min_fic_id=min_fic_id))
+        try:
+            while block := await next_block:
+                # A block smaller than the limit means there's nothing left to page through.
+                is_last = limit is not None and len(block) < limit
+                if not is_last:
+                    next_block = asyncio.ensure_future(get_block(min_fic_id=max(map(_get_id, block)) + 1))
+                yield block
+                if is_last:
+                    return
+        finally:
+            # If the prefetch already finished, nobody will await it now, so mark any error it raised as retrieved.
+            if not next_block.cancel() and not next_block.cancelled():
+                next_block.exception()
 
     async def get_story_metadata(self, ffn_id: int) -> Story:
         """Gets a specific FFN fic's metadata.
 
+        The result is reused for 5 minutes; see :meth:`invalidate` to drop it sooner.
+
         Parameters
         ----------
         ffn_id: :class:`int`
@@ -371,20 +784,140 @@ class Client:
             The metadata of the queried fanfic.
         """
 
+        if (story := self._story_cache.get(ffn_id)) is not None:
+            return story
+
         try:
-            return parse_story(await self._get(f"/ffn/meta/{ffn_id}"))
-        except (msgspec.MsgspecError, KeyError) as err:
+            story = parse_story(await self._get(f"/ffn/meta/{ffn_id}", persist=True))
+        except msgspec.MsgspecError as err:
             msg = f"Unable to load story metadata from FFN ID: {ffn_id}"
             raise AtlasException(msg) from err
 
+        self._story_cache.set(ffn_id, story)
+        return story
+
+    def invalidate(self, ffn_id: int) -> None:
+        """Drop a specific FFN fic's cached metadata, so the next lookup fetches it from the API again.
+
+        Parameters
+        ----------
+        ffn_id: :class:`int`
+            The FFN `id` to forget.
+        """
+
+        self._story_cache.pop(ffn_id)
+        if self._disk_cache:
+            self._disk_cache.pop((f"/ffn/meta/{ffn_id}", ()))
+
+    def clear_cache(self) -> None:
+        """Drop every cached response and story, both in memory and on disk."""
+
+        self._response_cache.clear()
+        self._story_cache.clear()
+        if self._disk_cache:
+            self._disk_cache.clear()
+
+    async def get_stories_metadata(self, ffn_ids: Iterable[int], *, use_bulk: bool = False) -> dict[int, Story]:
+        """Gets the metadata for multiple FFN fics.
+
+        Fics that are already cached aren't requested again. The rest are requested separately and concurrently,
+        within the limit on simultaneous requests.
+
+        Parameters
+        ----------
+        ffn_ids: Iterable[:class:`int`]
+            The FFN `id`s to lookup.
+        use_bulk: :class:`bool`, default=False
+            Whether to first try retrieving the fics as one block from the bulk endpoint when they're packed closely
+            enough together. The block is given up on after 10 seconds, which delays the individual requests.
+
+        Returns
+        -------
+        dict[:class:`int`, :class:`Story`]
+            A mapping of FFN ids to the metadata of the queried fanfics. Fics that couldn't be found are left out.
+
+        Raises
+        ------
+        AtlasException
+            If any lookup fails for a reason other than the fic not being found.
+        """
+
+        stories: dict[int, Story] = {}
+        wanted: set[int] = set()
+        for ffn_id in ffn_ids:
+            if (story := self._story_cache.get(ffn_id)) is not None:
+                stories[ffn_id] = story
+            else:
+                wanted.add(ffn_id)
+
+        if not wanted:
+            return stories
+
+        # Only use a bulk block when at least half of the ids it spans are wanted.
+        span = max(wanted) - min(wanted) + 1
+        if use_bulk and len(wanted) > 1 and span <= min(2 * len(wanted), _BULK_LIMIT):
+            await self._load_stories_from_disk(wanted, stories)
+            if wanted:
+                await self._load_stories_in_bulk(wanted, stories)
+
+        # Anything still missing, including fics a bulk block didn't contain, is requested individually.
+        results = await asyncio.gather(*(self.get_story_metadata(ffn_id) for ffn_id in wanted), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Story):
+                stories[result.id] = result
+            elif not (isinstance(result, AtlasException) and result.status == 404):
+                raise result
+        return stories
+
+    async def _load_stories_from_disk(self, wanted: set[int], stories: dict[int, Story]) -> None:
+        """Moves fics from `wanted` to `stories` if their responses are in the on-disk cache."""
+
+        if not self._disk_cache:
+            return
+
+        ffn_ids = list(wanted)
+        results = await asyncio.gather(*(self._disk_cache.get((f"/ffn/meta/{ffn_id}", ())) for ffn_id in ffn_ids))
+        for ffn_id, data in zip(ffn_ids, results):
+            if data is None:
+                continue
+            try:
+                story = parse_story(data)
+            except msgspec.MsgspecError:
+                continue
+            self._story_cache.set(ffn_id, story)
+            stories[ffn_id] = story
+            wanted.discard(ffn_id)
+
+    async def _load_stories_in_bulk(self, wanted: set[int], stories: dict[int, Story]) -> None:
+        """Moves fics from `wanted` to `stories` by requesting one block of the bulk endpoint that starts at the lowest.
+
+        The block isn't assumed to be sorted by id, so it may not contain every wanted fic. Errors and timeouts are
+        ignored, since any fics left in `wanted` are requested individually afterwards.
+        """
+
+        lowest = min(wanted)
+        try:
+            block = await asyncio.wait_for(
+                self.get_bulk_metadata(min_fic_id=lowest, limit=max(wanted) - lowest + 1),
+                _BULK_TIMEOUT,
+            )
+        except (AtlasException, msgspec.MsgspecError, asyncio.TimeoutError):
+            return
+
+        for story in block:
+            if story.id in wanted:
+                self._story_cache.set(story.id, story)
+                stories[story.id] = story
+                wanted.discard(story.id)
+
 
-def extract_fic_id(text: str) -> int | None:
+def extract_fic_id(text: str | bytes) -> int | None:
     """Extract the fic id from the first valid FFN url in a string.
 
     Parameters
     ----------
-    text: :class:`str`
-        The string to parse for an FFN url.
+    text: :class:`str` | :class:`bytes`
+        The string to parse for an FFN url. Bytes are searched as-is, without decoding them first.
 
     Returns
     -------
@@ -392,4 +925,11 @@ def extract_fic_id(text: str) -> int | None:
         The id of the first found fanfiction url in the string, if present.
     """
 
+    # Most text has no FFN url at all, and a plain substring check rules that out much faster than the regex can.
+    if isinstance(text, bytes):
+        if b"fanfiction.net/s/" not in text:
+            return None
+        return int(result.group("id")) if (result := _FFN_STORY_BYTES_REGEX.search(text)) else None
+    if "fanfiction.net/s/" not in text:
+        return None
     return int(result.group("id")) if (result := _FFN_STORY_REGEX.search(text)) else None
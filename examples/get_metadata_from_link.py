@@ -25,11 +25,10 @@ async def get_metadata_from_link() -> None:
     ffn_link = "https://www.fanfiction.net/s/13912800/1/Magical-Marvel"
     print(f"Getting metadata from this link: '{ffn_link}'")
 
-    # Create a ClientSession in order to close it gracefully. Not strictly necessary, since the atlas client can create
-    # its own session if it's used as an async context manager (i.e. async with).
-    async with aiohttp.ClientSession() as session:
-        client = atlas_api.Client(auth=atlas_auth, session=session)
-
+    # Use the client as an async context manager (i.e. async with) so that the session it creates is closed
+    # gracefully. Reuse one client for every request instead of making a new one each time, so its pooled
+    # connections to Atlas are kept alive between requests.
+    async with atlas_api.Client(auth=atlas_auth) as client:
         # Get the fic id (e.g. 14216823), then plug it into one of the client's get methods.
         ffn_id = atlas_api.extract_fic_id(ffn_link)
         assert ffn_id
@@ -27,31 +27,21 @@ async def parse_through_fandom() -> None:
     fandom_name = "Chronicles of Narnia"
     print(f"Getting information about fanfics in this fandom: {fandom_name}")
 
-    # Create a ClientSession in order to close it gracefully. Not strictly necessary, since the atlas client can create
-    # its own session if it's used as an async context manager (i.e. async with).
-    async with aiohttp.ClientSession() as session:
-        client = atlas_api.Client(auth=atlas_auth, session=session)
-
-        # Keep track of the page (of size 10000, per the API) and fic counts, as well as the first fic id for each page.
-        total_pages, total_fics, min_fic_id = 0, 0, 0
-
-        while True:
-            # Get the first 10,000 fics with this fandom name, starting from a certain fic id.
-            block = await client.get_bulk_metadata(min_fic_id=min_fic_id, raw_fandoms_ilike=fandom_name)
-            total_fics += len(block)
-
-            # No more fics to find in this fandom.
-            if len(block) < 1:
-                break
-
+    # Use the client as an async context manager (i.e. async with) so that the session it creates is closed
+    # gracefully. Reuse one client for every request instead of making a new one each time, so its pooled
+    # connections to Atlas are kept alive between requests.
+    async with atlas_api.Client(auth=atlas_auth) as client:
+        # Keep track of the page (of size 10000, per the API) and fic counts.
+        total_pages, total_fics = 0, 0
+
+        # Page through every fic with this fandom name. The client requests each next page in the background while
+        # the current one is being printed, and stops once there are no more fics to find in this fandom.
+        async for block in client.iter_bulk_metadata(raw_fandoms_ilike=fandom_name):
             total_pages += 1
+            total_fics += len(block)
 
-            for fic in block:
-                print(f"{fic.id}: {fic.title}")
-                print(f"    {fic.description}\n")
-
-            # Search for more fics using larger, uncovered fic ids as starting points.
-            min_fic_id = max(fic.id for fic in block) + 1
+            # Print the whole block at once rather than making two print calls per fic.
+            print("\n".join(f"{fic.id}: {fic.title}\n    {fic.description}\n" for fic in block))
 
         print(f"Done in {total_pages=}: {total_fics=}")
 
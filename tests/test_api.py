@@ -5,14 +5,20 @@ import pathlib
 
 import aiohttp
 import pytest
+import pytest_asyncio
 
 import atlas_api
 
 
-# Can't access the API without authorization credentials.
-with pathlib.Path("config.json").open(encoding="utf-8") as f:
-    info = json.load(f)
-atlas_auth = aiohttp.BasicAuth(*info.values())
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    # Can't access the API without authorization credentials.
+    with pathlib.Path("config.json").open(encoding="utf-8") as f:
+        info = json.load(f)
+    atlas_auth = aiohttp.BasicAuth(*info.values())
+
+    async with atlas_api.Client(auth=atlas_auth) as c:
+        yield c
 
 
 @pytest.mark.parametrize(
@@ -21,6 +27,7 @@ atlas_auth = aiohttp.BasicAuth(*info.values())
         ("https://www.fanfiction.net/s/13912800/1/Magical-Marvel", 13912800),
         ("https://www.fanfiction.net/s/14182918/1/", 14182918),
         ("https://www.fanfiction.net/s/asdfasdfasdf", None),
+        (b"https://m.fanfiction.net/s/13912800/1/Magical-Marvel", 13912800),
         (
             "https://www.fanfiction.net/Naruto-and-High-School-DxD-%E3%83%8F%E3%82%A4%E3%82%B9%E3%82%AF%E3%83%BC%E3%83%ABD-D-Crossovers/1402/9502/",
             None,
@@ -69,20 +76,51 @@ def test_parse_story():
     assert story.favorites == 878
     assert story.follows == 1073
     assert story.fandoms == ("Harry Potter",)
+    assert story.fandom_ids == (224, None)
     assert story.genres == ("Drama", "Supernatural")
 
 
-@pytest.mark.asyncio
-async def test_max_update_id():
-    async with atlas_api.Client(auth=atlas_auth) as client:
-        max_update_id = await client.max_update_id()
+def test_parse_story_characters():
+    test_data = """\
+{
+    "id": 13912800,
+    "author_id": 1,
+    "author_name": "author",
+    "title": "Magical Marvel",
+    "description": "description",
+    "published": "2021-06-13T04:52:38Z",
+    "is_complete": false,
+    "rating": "T",
+    "language": "English",
+    "chapter_count": 1,
+    "word_count": 1,
+    "review_count": 1,
+    "favorite_count": 1,
+    "follow_count": 1,
+    "raw_characters": "[Harry P., Hermione G.] Ron W., Luna L.",
+    "raw_fandoms": "Harry Potter and Avengers Crossovers",
+    "is_crossover": true
+}
+    """
+    story = atlas_api.parse_story(test_data)
+    assert story.characters == ("Harry P.", "Hermione G.", "Ron W.", "Luna L.")
+    assert story.fandoms == ("Harry Potter", "Avengers")
+    assert story.fandom_ids == ()
+
+
+@pytest.mark.live
+@pytest.mark.xdist_group("atlas_api")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_max_update_id(client):
+    max_update_id = await client.max_update_id()
     assert isinstance(max_update_id, int)
 
 
-@pytest.mark.asyncio
-async def test_max_story_id():
-    async with atlas_api.Client(auth=atlas_auth) as client:
-        max_story_id = await client.max_story_id()
+@pytest.mark.live
+@pytest.mark.xdist_group("atlas_api")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_max_story_id(client):
+    max_story_id = await client.max_story_id()
     assert isinstance(max_story_id, int)
 
 
@@ -90,31 +128,43 @@ async def test_max_story_id():
     "test_title_query",
     ["%Ashes of Chaos%"],
 )
-@pytest.mark.asyncio
-async def test_get_bulk_metadata(test_title_query):
-    async with atlas_api.Client(auth=atlas_auth) as client:
-        with pytest.raises(TimeoutError):  # NOTE: This endpoint is currently dead.
-            bulk_metadata = await asyncio.wait_for(
-                client.get_bulk_metadata(title_ilike=test_title_query, limit=5),
-                10.0,
-            )
-            assert test_title_query
-            for fic in bulk_metadata:
-                assert fic
-                assert fic.id
-                assert fic.title
-
-
-@pytest.mark.parametrize(
-    "test_url",
-    ["https://www.fanfiction.net/s/13912800/1/Magical-Marvel", "https://www.fanfiction.net/s/14182918/1/"],
-)
-@pytest.mark.asyncio
-async def test_get_story_metadata(test_url):
-    async with atlas_api.Client(auth=atlas_auth) as client:
-        ffn_id = atlas_api.extract_fic_id(test_url)
-        story_metadata = await client.get_story_metadata(ffn_id)
+@pytest.mark.live
+@pytest.mark.xdist_group("atlas_api")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_bulk_metadata(client, test_title_query):
+    with pytest.raises(TimeoutError):  # NOTE: This endpoint is currently dead.
+        bulk_metadata = await asyncio.wait_for(
+            client.get_bulk_metadata(title_ilike=test_title_query, limit=5),
+            10.0,
+        )
+        assert test_title_query
+        for fic in bulk_metadata:
+            assert fic
+            assert fic.id
+            assert fic.title
+
+
+@pytest.mark.live
+@pytest.mark.xdist_group("atlas_api")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_story_metadata(client):
+    test_urls = ["https://www.fanfiction.net/s/13912800/1/Magical-Marvel", "https://www.fanfiction.net/s/14182918/1/"]
+    results = await asyncio.gather(*(client.get_story_metadata(atlas_api.extract_fic_id(url)) for url in test_urls))
+    for story_metadata in results:
         assert story_metadata
         assert isinstance(story_metadata.id, int)
         assert story_metadata.title and isinstance(story_metadata.title, str)
         assert story_metadata.description and isinstance(story_metadata.description, str)
+
+
+@pytest.mark.live
+@pytest.mark.xdist_group("atlas_api")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_stories_metadata(client):
+    test_urls = ["https://www.fanfiction.net/s/13912800/1/Magical-Marvel", "https://www.fanfiction.net/s/14182918/1/"]
+    ffn_ids = [atlas_api.extract_fic_id(url) for url in test_urls]
+    results = await client.get_stories_metadata(ffn_ids)
+    assert results.keys() == set(ffn_ids)
+    for ffn_id, story_metadata in results.items():
+        assert story_metadata.id == ffn_id
+        assert story_metadata.title and isinstance(story_metadata.title, str)
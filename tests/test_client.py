@@ -0,0 +1,396 @@
+"""Offline tests for the client's request handling, using a stub in place of the HTTP session."""
+
+import asyncio
+import contextlib
+import gc
+import json
+import sqlite3
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+
+import atlas_api
+
+
+class StubResponse:
+    def __init__(self, status, body=b"", reason=...):
+        self.status = status
+        self.reason = HTTPStatus(status).phrase if reason is ... else reason
+        self.body = body
+
+    async def read(self):
+        return self.body
+
+
+class StubSession:
+    """Stands in for an aiohttp.ClientSession, answering requests with per-endpoint async handlers.
+
+    Handlers return either a response body or a whole StubResponse.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.closed = False
+
+    @contextlib.asynccontextmanager
+    async def get(self, url, params=None, headers=None, auth=None):
+        endpoint = url[len(atlas_api.ATLAS_BASE_URL) :]
+        self.requests.append((endpoint, params))
+        if (handler := self.routes.get(endpoint)) is None:
+            yield StubResponse(404)
+        else:
+            answer = await handler(params or {})
+            yield answer if isinstance(answer, StubResponse) else StubResponse(200, answer)
+
+    async def close(self):
+        self.closed = True
+
+
+async def never_answer(params):
+    await asyncio.Event().wait()
+
+
+def story_payload(ffn_id):
+    return {
+        "id": ffn_id,
+        "author_id": 1,
+        "author_name": "author",
+        "title": f"Story {ffn_id}",
+        "description": "description",
+        "published": "2023-01-01T00:00:00Z",
+        "is_complete": False,
+        "rating": "T",
+        "language": "English",
+        "chapter_count": 1,
+        "word_count": 1,
+        "review_count": 1,
+        "favorite_count": 1,
+        "follow_count": 1,
+        "is_crossover": False,
+    }
+
+
+def bulk_handler(ffn_ids):
+    """Answers bulk requests from a fixed list of ids, in the order given, like a paginated endpoint would."""
+
+    async def handler(params):
+        start = params.get("min_fic_id", 0)
+        matches = [ffn_id for ffn_id in ffn_ids if ffn_id >= start][: params.get("limit", 2)]
+        return json.dumps([story_payload(ffn_id) for ffn_id in matches]).encode()
+
+    return handler
+
+
+def respond_with(status, reason=...):
+    async def handler(params):
+        return StubResponse(status, reason=reason)
+
+    return handler
+
+
+def answer_after(body, delay=0.01):
+    async def handler(params):
+        await asyncio.sleep(delay)
+        return body
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_raising_sema_limit_releases_waiters():
+    client = atlas_api.Client(sema_limit=1)
+    started = []
+    release = asyncio.Event()
+
+    async def hold_slot(i):
+        async with client._request_slot():
+            started.append(i)
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold_slot(i)) for i in range(3)]
+    await asyncio.sleep(0.01)
+    assert started == [0]
+
+    client.sema_limit = 3
+    await asyncio.sleep(0.01)
+    assert started == [0, 1, 2]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert client._active_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_response():
+    session = StubSession({"/ffn/id": answer_after(b"123")})
+    client = atlas_api.Client(session=session)
+
+    assert await asyncio.gather(*(client.max_story_id() for _ in range(3))) == [123, 123, 123]
+    assert len(session.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_reused_until_it_expires():
+    session = StubSession({"/update_id": answer_after(b"456", delay=0)})
+    client = atlas_api.Client(session=session)
+
+    assert await client.max_update_id() == 456
+    assert await client.max_update_id() == 456
+    assert len(session.requests) == 1
+
+    client._response_cache.ttl = 0.0
+    client._response_cache.clear()
+    await client.max_update_id()
+    await client.max_update_id()
+    assert len(session.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_free_their_slots():
+    session = StubSession({"/ffn/meta/": never_answer, "/update_id": answer_after(b"456")})
+    client = atlas_api.Client(session=session, sema_limit=2)
+
+    for title in ("%a%", "%b%"):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.get_bulk_metadata(title_ilike=title), 0.05)
+
+    assert await asyncio.wait_for(client.max_update_id(), 1.0) == 456
+    assert client._active_requests == 0
+    assert not client._inflight_requests
+
+
+@pytest.mark.asyncio
+async def test_identical_request_after_a_cancelled_one_starts_fresh():
+    session = StubSession({"/ffn/id": answer_after(b"123", delay=0.05)})
+    client = atlas_api.Client(session=session)
+
+    first = asyncio.ensure_future(client.max_story_id())
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+
+    assert await asyncio.wait_for(client.max_story_id(), 1.0) == 123
+    assert len(session.requests) == 2
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_shared_request_survives_one_cancelled_caller():
+    session = StubSession({"/ffn/id": answer_after(b"123", delay=0.05)})
+    client = atlas_api.Client(session=session)
+
+    first = asyncio.create_task(client.max_story_id())
+    second = asyncio.create_task(client.max_story_id())
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == 123
+    assert first.cancelled()
+    assert len(session.requests) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, 10001])
+async def test_get_bulk_metadata_rejects_limits_out_of_range(limit):
+    session = StubSession({"/ffn/meta/": bulk_handler([1, 2, 3])})
+    client = atlas_api.Client(session=session)
+
+    with pytest.raises(ValueError, match="between 1 and 10000"):
+        await client.get_bulk_metadata(limit=limit)
+    assert not session.requests
+
+
+@pytest.mark.asyncio
+async def test_error_status_is_raised_with_its_reason():
+    session = StubSession({"/update_id": respond_with(500), "/ffn/id": respond_with(503, reason=None)})
+    client = atlas_api.Client(session=session)
+
+    with pytest.raises(atlas_api.AtlasException, match="HTTP 500: Internal Server Error") as exc_info:
+        await client.max_update_id()
+    assert exc_info.value.status == 500
+
+    with pytest.raises(atlas_api.AtlasException, match="HTTP 503: None"):
+        await client.max_story_id()
+
+
+@pytest.mark.asyncio
+async def test_iter_bulk_metadata_pages_until_exhausted():
+    session = StubSession({"/ffn/meta/": bulk_handler([1, 2, 3, 4, 5])})
+    client = atlas_api.Client(session=session)
+
+    blocks = [[story.id for story in block] async for block in client.iter_bulk_metadata(limit=2)]
+    assert blocks == [[1, 2], [3, 4], [5]]
+    assert [params["min_fic_id"] for _, params in session.requests[1:]] == [3, 5]
+
+
+@pytest.mark.asyncio
+async def test_iter_bulk_metadata_stops_early_without_leaking_prefetch(caplog):
+    async def fail_after_first(params):
+        if params.get("min_fic_id"):
+            return b"not json"
+        return json.dumps([story_payload(1), story_payload(2)]).encode()
+
+    session = StubSession({"/ffn/meta/": fail_after_first})
+    client = atlas_api.Client(session=session)
+
+    blocks = client.iter_bulk_metadata(limit=2)
+    assert [story.id for story in await blocks.__anext__()] == [1, 2]
+    await asyncio.sleep(0.1)  # Let the failing prefetch finish before the consumer stops.
+    await blocks.aclose()
+    del blocks
+    gc.collect()
+    assert "never retrieved" not in caplog.text
+
+    never_answered = StubSession({"/ffn/meta/": never_answer})
+    client = atlas_api.Client(session=never_answered)
+    blocks = client.iter_bulk_metadata()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(blocks.__anext__(), 0.05)
+    assert client._active_requests == 0
+
+
+def story_routes(*ffn_ids):
+    return {
+        f"/ffn/meta/{ffn_id}": answer_after(json.dumps(story_payload(ffn_id)).encode(), delay=0) for ffn_id in ffn_ids
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_stories_metadata_uses_one_bulk_block_for_dense_ids():
+    session = StubSession({"/ffn/meta/": bulk_handler([10, 11, 12, 13])})
+    client = atlas_api.Client(session=session)
+
+    stories = await client.get_stories_metadata([12, 10, 11], use_bulk=True)
+    assert sorted(stories) == [10, 11, 12]
+    assert session.requests == [("/ffn/meta/", {"min_fic_id": 10, "limit": 3})]
+
+
+@pytest.mark.asyncio
+async def test_get_stories_metadata_fetches_fics_missing_from_an_unsorted_block():
+    session = StubSession({"/ffn/meta/": bulk_handler([10, 13, 11, 12]), **story_routes(12)})
+    client = atlas_api.Client(session=session)
+
+    stories = await client.get_stories_metadata([10, 11, 12], use_bulk=True)
+    assert sorted(stories) == [10, 11, 12]
+    assert [endpoint for endpoint, _ in session.requests] == ["/ffn/meta/", "/ffn/meta/12"]
+
+
+@pytest.mark.asyncio
+async def test_get_stories_metadata_skips_the_bulk_endpoint_by_default():
+    session = StubSession({"/ffn/meta/": never_answer, **story_routes(10, 11)})
+    client = atlas_api.Client(session=session)
+
+    stories = await asyncio.wait_for(client.get_stories_metadata([10, 11]), 1.0)
+    assert sorted(stories) == [10, 11]
+    assert all(endpoint != "/ffn/meta/" for endpoint, _ in session.requests)
+
+
+@pytest.mark.asyncio
+async def test_get_stories_metadata_gathers_sparse_ids_and_drops_missing_ones():
+    session = StubSession(story_routes(1, 50000))
+    client = atlas_api.Client(session=session)
+
+    stories = await client.get_stories_metadata([1, 50000, 99999])
+    assert sorted(stories) == [1, 50000]
+    endpoints = sorted(endpoint for endpoint, _ in session.requests)
+    assert endpoints == ["/ffn/meta/1", "/ffn/meta/50000", "/ffn/meta/99999"]
+
+
+@pytest.mark.asyncio
+async def test_get_stories_metadata_raises_errors_other_than_not_found():
+    session = StubSession({"/ffn/meta/1": respond_with(401), "/ffn/meta/50000": respond_with(401)})
+    client = atlas_api.Client(session=session)
+
+    with pytest.raises(atlas_api.AtlasException, match="HTTP 401: Unauthorized") as exc_info:
+        await client.get_stories_metadata([1, 50000])
+    assert exc_info.value.status == 401
+
+
+@pytest.mark.asyncio
+async def test_get_stories_metadata_falls_back_when_the_bulk_endpoint_hangs(monkeypatch):
+    monkeypatch.setattr(atlas_api, "_BULK_TIMEOUT", 0.01)
+    session = StubSession({"/ffn/meta/": never_answer, **story_routes(10, 12)})
+    client = atlas_api.Client(session=session)
+
+    stories = await client.get_stories_metadata([10, 11, 12], use_bulk=True)
+    assert sorted(stories) == [10, 12]
+    assert client._active_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_persists_story_responses(tmp_path):
+    cache_path = tmp_path / "cache.sqlite3"
+    session = StubSession({"/ffn/meta/7": answer_after(json.dumps(story_payload(7)).encode(), delay=0)})
+
+    async with atlas_api.Client(session=session, cache_path=cache_path) as client:
+        assert (await client.get_story_metadata(7)).id == 7
+    assert len(session.requests) == 1
+
+    session.closed = False
+    async with atlas_api.Client(session=session, cache_path=cache_path) as client:
+        assert (await client.get_story_metadata(7)).id == 7
+        assert len(session.requests) == 1
+
+        client.invalidate(7)
+        await client.get_story_metadata(7)
+        assert len(session.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_purges_expired_entries_on_open(tmp_path):
+    cache_path = tmp_path / "cache.sqlite3"
+    session = StubSession({"/ffn/meta/7": answer_after(json.dumps(story_payload(7)).encode(), delay=0)})
+
+    async with atlas_api.Client(session=session, cache_path=cache_path) as client:
+        client._disk_cache.ttl = -1.0
+        await client.get_story_metadata(7)
+
+    with contextlib.closing(sqlite3.connect(cache_path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM responses").fetchone() == (1,)
+
+    async with atlas_api.Client(session=session, cache_path=cache_path) as client:
+        assert await client._disk_cache.get(("/ffn/meta/7", ())) is None
+
+    with contextlib.closing(sqlite3.connect(cache_path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM responses").fetchone() == (0,)
+
+
+@pytest.mark.asyncio
+async def test_broken_disk_cache_does_not_break_lookups(tmp_path, caplog):
+    session = StubSession(story_routes(7))
+
+    async with atlas_api.Client(session=session, cache_path=tmp_path) as client:
+        assert (await client.get_story_metadata(7)).id == 7
+    assert len(session.requests) == 1
+    assert "Couldn't read from the on-disk cache" in caplog.text
+    assert "An operation on the on-disk cache failed." in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_auth_is_passed_per_request_to_a_given_session():
+    sent = []
+
+    class RecordingSession(StubSession):
+        def get(self, url, params=None, headers=None, auth=None):
+            sent.append((headers, auth))
+            return super().get(url, params, headers, auth)
+
+    auth = aiohttp.BasicAuth("user", "password")
+    client = atlas_api.Client(auth=auth, session=RecordingSession(story_routes(7)))
+
+    await client.get_story_metadata(7)
+    [(headers, sent_auth)] = sent
+    assert sent_auth is auth
+    assert "Authorization" not in headers
+
+
+@pytest.mark.asyncio
+async def test_auth_is_encoded_into_an_owned_session():
+    auth = aiohttp.BasicAuth("user", "password")
+    async with atlas_api.Client(auth=auth) as client:
+        await client.start_session()
+        assert client.session.headers["Authorization"] == auth.encode()
+    assert "Authorization" not in client.headers
+